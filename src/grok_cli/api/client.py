@@ -1,21 +1,21 @@
 """Grok API client for grok-cli."""
 
 import os
-import json
-from typing import Dict, List, Optional, Any
+import sys
+import time
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Generator, List, Optional
 from dataclasses import dataclass, field
 from datetime import datetime
 
+import orjson
 import requests
-from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-from rich.console import Console
-from rich.panel import Panel
-
-console = Console()
-
-# Load environment variables
-load_dotenv()
+from grok_cli.utils.console import console
 
 # Available Grok models - we'll try these in order if MODEL_NAME is not set
 GROK_MODELS = [
@@ -26,50 +26,122 @@ GROK_MODELS = [
     "grok",
 ]
 
+# dataclass(slots=True) is only available from Python 3.10
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# How long a discovered model stays valid in the on-disk cache
+MODEL_CACHE_TTL = 7 * 86400
+
+# Connections kept per host; also bounds concurrent batched requests
+POOL_MAXSIZE = 16
+
+
+def _load_env_file() -> None:
+    """Load environment variables from a .env file in the working directory."""
+    if os.path.exists(".env"):
+        from dotenv import load_dotenv
+
+        load_dotenv(".env")
+
+
+# Wall-clock anchor for monotonic message timestamps, taken once per process
+_EPOCH_BASE = time.time()
+_MONOTONIC_BASE_NS = time.monotonic_ns()
+
+
+def _to_wall_clock(monotonic_ns: int) -> float:
+    """Convert a monotonic message timestamp to epoch seconds."""
+    return _EPOCH_BASE + (monotonic_ns - _MONOTONIC_BASE_NS) / 1e9
+
+
+def _parse_timestamp(value: Any) -> int:
+    """Parse a saved message timestamp (epoch seconds, or ISO text in old saves)."""
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value).timestamp()
+    return _MONOTONIC_BASE_NS + int((value - _EPOCH_BASE) * 1e9)
+
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class Message:
     """Represents a message in the conversation."""
 
     role: str  # "user" or "assistant"
     content: str
-    timestamp: datetime = field(default_factory=datetime.now)
+    # Monotonic nanoseconds; converted to wall-clock time only when saving
+    timestamp: int = field(default_factory=time.monotonic_ns)
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class Conversation:
     """Represents a conversation session with Grok."""
 
     messages: List[Message] = field(default_factory=list)
     context: str = ""
     session_id: str = ""
+    # API-formatted messages, kept in sync so sends don't rebuild the list
+    _api_messages: List[Dict[str, str]] = field(
+        default_factory=list, init=False, repr=False
+    )
+    # Running total of context and message lengths
+    _total_len: int = field(default=0, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._rebuild_api_messages()
+        self._total_len = len(self.context) + sum(
+            len(msg.content) for msg in self.messages
+        )
+
+    def _system_message(self) -> Dict[str, str]:
+        """Build the system message carrying the file/directory context."""
+        return {
+            "role": "system",
+            "content": f"Context:\n{self.context}\n\nYou are a helpful AI assistant. You can analyze code, suggest improvements, and help with development tasks. When you suggest shell commands, format them clearly and explain what they do.",
+        }
+
+    def _rebuild_api_messages(self) -> None:
+        """Rebuild the API-formatted message list from scratch."""
+        api_messages = [self._system_message()] if self.context else []
+        api_messages.extend(
+            {"role": msg.role, "content": msg.content} for msg in self.messages
+        )
+        self._api_messages = api_messages
 
     def add_message(self, role: str, content: str) -> None:
         """Add a message to the conversation."""
         self.messages.append(Message(role=role, content=content))
+        self._api_messages.append({"role": role, "content": content})
+        self._total_len += len(content)
+
+    def set_context(self, context: str) -> None:
+        """Replace the file/directory context of the conversation."""
+        had_context = bool(self.context)
+        self._total_len += len(context) - len(self.context)
+        self.context = context
+
+        # Only the system message depends on the context; update it in place
+        if context and had_context:
+            self._api_messages[0] = self._system_message()
+        elif context:
+            self._api_messages.insert(0, self._system_message())
+        elif had_context:
+            del self._api_messages[0]
+
+    def clear_messages(self) -> None:
+        """Remove all messages, keeping the context."""
+        self.messages.clear()
+        self._rebuild_api_messages()
+        self._total_len = len(self.context)
 
     def get_context_length(self) -> int:
         """Get the total length of conversation context."""
-        return sum(len(msg.content) for msg in self.messages) + len(self.context)
+        return self._total_len
 
     def format_for_api(self) -> List[Dict[str, str]]:
-        """Format conversation for Grok API."""
-        messages = []
-
-        # Add system context if available
-        if self.context:
-            messages.append(
-                {
-                    "role": "system",
-                    "content": f"Context:\n{self.context}\n\nYou are a helpful AI assistant. You can analyze code, suggest improvements, and help with development tasks. When you suggest shell commands, format them clearly and explain what they do.",
-                }
-            )
-
-        # Add conversation messages
-        for msg in self.messages:
-            messages.append({"role": msg.role, "content": msg.content})
+        """Format conversation for Grok API.
 
-        return messages
+        The returned list is maintained incrementally and must not be mutated.
+        """
+        return self._api_messages
 
 
 class GrokAPIClient:
@@ -80,6 +152,7 @@ class GrokAPIClient:
         api_key: Optional[str] = None,
         base_url: Optional[str] = None,
         model_name: Optional[str] = None,
+        batch_mode: bool = False,
     ):
         """Initialize the Grok API client.
 
@@ -87,22 +160,57 @@ class GrokAPIClient:
             api_key: Grok API key (defaults to GROK_API_KEY env var)
             base_url: Grok API base URL (defaults to official endpoint)
             model_name: Model name to use (defaults to MODEL_NAME env var or .env)
+            batch_mode: Send batched messages concurrently instead of one by one
         """
-        self.api_key = api_key or os.getenv("GROK_API_KEY")
-        if not self.api_key:
+        _load_env_file()
+
+        api_key = api_key or os.getenv("GROK_API_KEY")
+        if not api_key:
             raise ValueError(
                 "GROK API key is required. Set GROK_API_KEY environment variable."
             )
+        # Narrowed to str by the check above
+        self.api_key: str = api_key
 
         self.base_url = base_url or "https://api.x.ai/v1"
+        self.batch_mode = batch_mode
         self.session = requests.Session()
         self.session.headers.update(
             {
                 "Authorization": f"Bearer {self.api_key}",
                 "Content-Type": "application/json",
+                "Accept-Encoding": "gzip",
+                "Connection": "keep-alive",
             }
         )
 
+        # Reuse connections across discovery and chat requests, and retry
+        # transient failures instead of surfacing them to the chat loop
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=POOL_MAXSIZE,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=["POST", "GET"],
+                raise_on_status=False,
+            ),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        # Chat requests all share the same URL and headers, so prepare them
+        # once; each send only swaps in the encoded body
+        chat_url = f"{self.base_url}/chat/completions"
+        self._chat_request = self.session.prepare_request(
+            requests.Request("POST", chat_url)
+        )
+        self._send_settings = self.session.merge_environment_settings(
+            chat_url, {}, None, None, None
+        )
+        self._send_settings.pop("stream", None)
+
         # Initialize conversation
         self.conversation = Conversation()
 
@@ -113,27 +221,95 @@ class GrokAPIClient:
                 f"[green]✓[/green] Using model from MODEL_NAME: [bold]{self.model}[/bold]"
             )
         else:
-            self.model = self._discover_available_model()
+            self.model = self._load_cached_model() or self._discover_available_model()
+
+    def _model_cache_path(self) -> Path:
+        """Get the cache file holding the discovered model for this API key."""
+        cache_home = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+        key_hash = hashlib.blake2b(self.api_key.encode(), digest_size=8).hexdigest()
+        return cache_home / "grok-cli" / f"model-{key_hash}.json"
+
+    def _load_cached_model(self) -> Optional[str]:
+        """Load a previously discovered model if the cache entry is still fresh."""
+        try:
+            with open(self._model_cache_path(), "rb") as f:
+                data = orjson.loads(f.read())
+            model = data["model"]
+            if isinstance(model, str) and time.time() - data["ts"] < MODEL_CACHE_TTL:
+                console.print(
+                    f"[green]✓[/green] Using cached model: [bold]{model}[/bold]"
+                )
+                return model
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        return None
+
+    def _store_cached_model(self, model: str) -> None:
+        """Persist the discovered model so later launches skip discovery."""
+        try:
+            cache_path = self._model_cache_path()
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(cache_path, "wb") as f:
+                f.write(orjson.dumps({"model": model, "ts": time.time()}))
+        except OSError as e:
+            console.print(f"[dim]Could not cache model choice: {e}[/dim]")
 
     def _discover_available_model(self) -> str:
         """Discover which Grok model is available for this API key."""
         console.print("[dim]Discovering available Grok model...[/dim]")
 
-        for model in GROK_MODELS:
-            try:
-                # Test with a simple request
-                test_payload = {
-                    "model": model,
-                    "messages": [{"role": "user", "content": "Hello"}],
-                    "max_tokens": 10,
+        try:
+            response = self.session.get(f"{self.base_url}/models", timeout=5)
+            if response.status_code == 200:
+                available = {
+                    m["id"] for m in orjson.loads(response.content).get("data", [])
                 }
-
-                response = self.session.post(
-                    f"{self.base_url}/chat/completions", json=test_payload, timeout=10
+                model = next((m for m in GROK_MODELS if m in available), None)
+                if model:
+                    console.print(f"[green]✓[/green] Using model: {model}")
+                    self._store_cached_model(model)
+                    return model
+                console.print(
+                    f"[yellow]Warning: No known models listed, using {GROK_MODELS[0]} as fallback[/yellow]"
                 )
+                return GROK_MODELS[0]
+            elif response.status_code != 404:
+                console.print(
+                    f"[dim]Model listing returned status {response.status_code}[/dim]"
+                )
+        except Exception as e:
+            console.print(f"[dim]Error listing models: {e}[/dim]")
+
+        # Fall back to probing each candidate model
+        return self._probe_available_model()
+
+    def _probe_model(self, model: str) -> requests.Response:
+        """Send a minimal completion request for a single candidate model."""
+        test_payload = {
+            "model": model,
+            "messages": [{"role": "user", "content": "Hello"}],
+            "max_tokens": 10,
+        }
+        return self.session.post(
+            f"{self.base_url}/chat/completions",
+            data=orjson.dumps(test_payload),
+            timeout=10,
+        )
+
+    def _probe_available_model(self) -> str:
+        """Probe the candidate models concurrently and pick the preferred one."""
+        # Probes share the pooled session, so they overlap instead of paying
+        # one round trip per candidate; results are still checked in order
+        with ThreadPoolExecutor(max_workers=len(GROK_MODELS)) as executor:
+            futures = [executor.submit(self._probe_model, m) for m in GROK_MODELS]
+
+        for model, future in zip(GROK_MODELS, futures):
+            try:
+                response = future.result()
 
                 if response.status_code == 200:
                     console.print(f"[green]✓[/green] Using model: {model}")
+                    self._store_cached_model(model)
                     return model
                 elif response.status_code == 404:
                     console.print(f"[dim]Model {model} not available[/dim]")
@@ -160,11 +336,10 @@ class GrokAPIClient:
         Args:
             context: File/directory context to include in conversation
         """
-        self.conversation.context = context
-        console.print(f"[green]✓[/green] Context set ({len(context)} characters)")
+        self.conversation.set_context(context)
 
     def send_message(self, message: str) -> Optional[str]:
-        """Send a message to Grok and get a response.
+        """Send a message to Grok and stream the response to the console.
 
         Args:
             message: User message to send
@@ -172,6 +347,43 @@ class GrokAPIClient:
         Returns:
             Grok's response, or None if there was an error
         """
+        chunks = []
+        stream = self.send_message_stream(message)
+        try:
+            while True:
+                chunk = next(stream)
+                console.print(chunk, end="", markup=False, highlight=False)
+                chunks.append(chunk)
+        except StopIteration as done:
+            complete = done.value
+
+        if chunks:
+            console.print()
+        if not complete or not chunks:
+            return None
+
+        assistant_message = "".join(chunks)
+        console.print(
+            f"[green]✓[/green] Response received ({len(assistant_message)} characters)"
+        )
+        return assistant_message
+
+    def send_message_stream(self, message: str) -> Generator[str, None, bool]:
+        """Send a message to Grok and yield the response as it arrives.
+
+        The complete response is added to the conversation once the stream
+        ends. Errors are reported on the console and end the stream early;
+        the generator's return value tells the two apart.
+
+        Args:
+            message: User message to send
+
+        Yields:
+            Chunks of Grok's response text
+
+        Returns:
+            True if the reply arrived in full, False if it was cut short
+        """
         try:
             # Add user message to conversation
             self.conversation.add_message("user", message)
@@ -182,41 +394,133 @@ class GrokAPIClient:
                 "messages": self.conversation.format_for_api(),
                 "max_tokens": 4000,
                 "temperature": 0.7,
-                "stream": False,
+                "stream": True,
             }
 
             console.print(
                 f"[dim]Sending message to Grok API (model: {self.model})...[/dim]"
             )
 
-            # Make API request
-            response = self.session.post(
-                f"{self.base_url}/chat/completions", json=payload, timeout=30
-            )
+            # Make API request; the read timeout bounds the gap between chunks,
+            # not the whole reply, so long generations still stream while a
+            # stalled connection is given up on
+            response = self._send_chat_request(payload, timeout=(5, 30), stream=True)
+
+            with response:
+                if response.status_code != 200:
+                    error_msg = f"API Error {response.status_code}: {response.text}"
+                    console.print(f"[red]✗[/red] {error_msg}")
+                    return False
+
+                chunks = []
+                # Set by the end-of-stream marker or a finish reason; a
+                # connection that just closes leaves the reply incomplete
+                finished = False
+                for line in response.iter_lines():
+                    if not line or not line.startswith(b"data: "):
+                        continue
+                    data = line[len(b"data: ") :]
+                    if data == b"[DONE]":
+                        finished = True
+                        break
+
+                    choices = orjson.loads(data).get("choices") or [{}]
+                    delta = choices[0].get("delta", {}).get("content")
+                    if delta:
+                        chunks.append(delta)
+                        yield delta
+                    if choices[0].get("finish_reason"):
+                        finished = True
+
+            if not finished:
+                console.print("[red]✗[/red] Response ended before it was complete")
+                return False
+
+            assistant_message = "".join(chunks)
+
+            # Add assistant response to conversation
+            self.conversation.add_message("assistant", assistant_message)
+            return True
 
-            if response.status_code == 200:
-                data = response.json()
-                assistant_message = data["choices"][0]["message"]["content"]
+        except requests.exceptions.RequestException as e:
+            console.print(f"[red]✗[/red] Network error: {e}")
+        except Exception as e:
+            console.print(f"[red]✗[/red] Unexpected error: {e}")
+        return False
 
-                # Add assistant response to conversation
-                self.conversation.add_message("assistant", assistant_message)
+    def send_messages_batch(self, messages: List[str]) -> List[Optional[str]]:
+        """Send several independent messages to Grok.
 
-                console.print(
-                    f"[green]✓[/green] Response received ({len(assistant_message)} characters)"
-                )
-                return assistant_message
+        Each message is sent against the current conversation. In batch mode the
+        requests overlap on the shared connection pool; otherwise they are sent
+        one after another. Exchanges are recorded in the order given.
+
+        Args:
+            messages: User messages to send
+
+        Returns:
+            Grok's responses in the same order, with None for failed requests
+        """
+        if not self.batch_mode or len(messages) < 2:
+            return [self.send_message(message) for message in messages]
+
+        history = self.conversation.format_for_api()
+        payloads = [
+            {
+                "model": self.model,
+                "messages": history + [{"role": "user", "content": message}],
+                "max_tokens": 4000,
+                "temperature": 0.7,
+                "stream": False,
+            }
+            for message in messages
+        ]
+
+        console.print(
+            f"[dim]Sending {len(messages)} messages to Grok API (model: {self.model})...[/dim]"
+        )
+        with ThreadPoolExecutor(
+            max_workers=min(len(payloads), POOL_MAXSIZE)
+        ) as executor:
+            responses = list(executor.map(self._request_completion, payloads))
+
+        for message, response in zip(messages, responses):
+            self.conversation.add_message("user", message)
+            if response is not None:
+                self.conversation.add_message("assistant", response)
 
-            else:
-                error_msg = f"API Error {response.status_code}: {response.text}"
-                console.print(f"[red]✗[/red] {error_msg}")
-                return None
+        console.print(
+            f"[green]✓[/green] Received {sum(r is not None for r in responses)}/{len(responses)} responses"
+        )
+        return responses
+
+    def _send_chat_request(
+        self, payload: Dict[str, Any], timeout: Any, stream: bool = False
+    ) -> requests.Response:
+        """Send a chat completion request built from the prepared template."""
+        request = self._chat_request.copy()
+        request.body = orjson.dumps(payload)
+        request.headers["Content-Length"] = str(len(request.body))
+        return self.session.send(
+            request, timeout=timeout, stream=stream, **self._send_settings
+        )
 
+    def _request_completion(self, payload: Dict[str, Any]) -> Optional[str]:
+        """Send a non-streaming completion request and return the reply text."""
+        try:
+            response = self._send_chat_request(payload, timeout=(5, 60))
+            if response.status_code == 200:
+                data = orjson.loads(response.content)
+                return data["choices"][0]["message"]["content"]
+
+            console.print(
+                f"[red]✗[/red] API Error {response.status_code}: {response.text}"
+            )
         except requests.exceptions.RequestException as e:
             console.print(f"[red]✗[/red] Network error: {e}")
-            return None
         except Exception as e:
             console.print(f"[red]✗[/red] Unexpected error: {e}")
-            return None
+        return None
 
     def get_conversation_summary(self) -> Dict[str, Any]:
         """Get a summary of the current conversation."""
@@ -233,7 +537,7 @@ class GrokAPIClient:
 
     def clear_conversation(self) -> None:
         """Clear the conversation history."""
-        self.conversation.messages.clear()
+        self.conversation.clear_messages()
         console.print("[yellow]Conversation history cleared[/yellow]")
 
     def save_conversation(self, filepath: str) -> bool:
@@ -246,21 +550,30 @@ class GrokAPIClient:
             True if successful, False otherwise
         """
         try:
-            conversation_data = {
-                "timestamp": datetime.now().isoformat(),
-                "context": self.conversation.context,
-                "messages": [
-                    {
-                        "role": msg.role,
-                        "content": msg.content,
-                        "timestamp": msg.timestamp.isoformat(),
-                    }
-                    for msg in self.conversation.messages
-                ],
-            }
+            # Stream the document one message at a time instead of building
+            # (and encoding) a copy of the whole conversation in memory
+            with open(filepath, "wb") as f:
+                f.write(b'{\n"timestamp": ')
+                f.write(orjson.dumps(datetime.now().isoformat()))
+                f.write(b',\n"context": ')
+                f.write(orjson.dumps(self.conversation.context))
+                f.write(b',\n"messages": [')
+
+                separator = b"\n"
+                for msg in self.conversation.messages:
+                    f.write(separator)
+                    f.write(
+                        orjson.dumps(
+                            {
+                                "role": msg.role,
+                                "content": msg.content,
+                                "timestamp": _to_wall_clock(msg.timestamp),
+                            }
+                        )
+                    )
+                    separator = b",\n"
 
-            with open(filepath, "w") as f:
-                json.dump(conversation_data, f, indent=2)
+                f.write(b"\n]\n}\n")
 
             console.print(f"[green]✓[/green] Conversation saved to {filepath}")
             return True
@@ -279,21 +592,22 @@ class GrokAPIClient:
             True if successful, False otherwise
         """
         try:
-            with open(filepath, "r") as f:
-                data = json.load(f)
-
-            self.conversation.context = data.get("context", "")
-            self.conversation.messages.clear()
-
-            for msg_data in data.get("messages", []):
-                timestamp = datetime.fromisoformat(msg_data["timestamp"])
-                self.conversation.messages.append(
-                    Message(
-                        role=msg_data["role"],
-                        content=msg_data["content"],
-                        timestamp=timestamp,
-                    )
+            with open(filepath, "rb") as f:
+                data = orjson.loads(f.read())
+
+            messages = [
+                Message(
+                    role=msg_data["role"],
+                    content=msg_data["content"],
+                    timestamp=_parse_timestamp(msg_data["timestamp"]),
                 )
+                for msg_data in data.get("messages", [])
+            ]
+            self.conversation = Conversation(
+                messages=messages,
+                context=data.get("context", ""),
+                session_id=self.conversation.session_id,
+            )
 
             console.print(f"[green]✓[/green] Conversation loaded from {filepath}")
             return True
@@ -1,26 +1,70 @@
 """Main CLI application for grok-cli."""
 
 import click
+import threading
 from pathlib import Path
-from typing import Optional
-from rich.console import Console
-from rich.panel import Panel
-from rich.prompt import Prompt
-from rich.prompt import Confirm
-from rich.live import Live
-from rich.table import Table
-from rich.text import Text
-from time import sleep
+from typing import Any, Callable, Optional
 
-from grok_cli.services.app_factory import AppFactory
-from grok_cli.utils.file_handler import scan_directory, format_directory_tree
-from grok_cli.utils.ui import print_ascii_art, loading_spinner, error_panel, info_panel
+from grok_cli.utils.console import console
 
-console = Console()
+# Heavier UI, API and filesystem modules are imported inside the functions that
+# use them, so `grok-cli --help` does not pay for them
+
+# Seconds an operation may take before a spinner is shown for it
+SPINNER_DELAY = 0.2
+
+
+def run_with_spinner(text: str, func: Callable[..., Any], *args: Any) -> Any:
+    """Run a function, showing a spinner only if it is still busy after a delay.
+
+    The function runs on the calling thread, so Ctrl-C interrupts it
+    immediately; a timer starts the Live display only once SPINNER_DELAY has
+    passed, and fast operations never start it or its refresh thread.
+
+    Args:
+        text: Spinner label
+        func: Function to run
+        *args: Positional arguments for func
+
+    Returns:
+        Whatever func returns; exceptions raised by func propagate
+    """
+    live = None
+    finished = False
+    # Keeps the timer from starting the spinner after func has returned
+    lock = threading.Lock()
+
+    def show_spinner() -> None:
+        nonlocal live
+        from rich.live import Live
+
+        from grok_cli.utils.ui import loading_spinner
+
+        with lock:
+            if not finished:
+                live = Live(
+                    loading_spinner(text), refresh_per_second=8, console=console
+                )
+                live.start()
+
+    timer = threading.Timer(SPINNER_DELAY, show_spinner)
+    timer.daemon = True
+    timer.start()
+    try:
+        return func(*args)
+    finally:
+        timer.cancel()
+        with lock:
+            finished = True
+            if live is not None:
+                live.stop()
 
 
 def show_context_menu() -> str:
     """Show a visually appealing context selection menu."""
+    from rich.prompt import Prompt
+    from rich.table import Table
+
     console.print("\n[bold cyan]Context Selection[/bold cyan]")
     console.print("=" * 50)
 
@@ -44,11 +88,18 @@ def show_context_menu() -> str:
 
 def get_custom_context() -> Optional[Path]:
     """Get custom context from user input."""
+    from rich.prompt import Confirm, Prompt
+    from rich.text import Text
+
+    from grok_cli.utils.ui import error_panel
+
     console.print("\n[bold cyan]Custom Context Selection[/bold cyan]")
     console.print("Enter the path to a file or directory you want to use as context:")
 
+    # Parsed once; the question is asked again after every bad path
+    path_prompt = Text.from_markup("[bold]Path[/bold]", style="prompt")
     while True:
-        custom_path = Prompt.ask("[bold]Path[/bold]")
+        custom_path = Prompt.ask(path_prompt)
         context_path = Path(custom_path)
 
         if not context_path.exists():
@@ -70,6 +121,17 @@ def main(path: Optional[str] = None) -> None:
         grok-cli                    # Use current directory as context
         grok-cli <file_or_dir>      # Use specific file or directory as context
     """
+    from rich.panel import Panel
+    from rich.text import Text
+
+    from grok_cli.services.app_factory import AppFactory
+    from grok_cli.utils.file_handler import scan_directory, format_directory_tree
+    from grok_cli.utils.ui import (
+        print_ascii_art,
+        error_panel,
+        info_panel,
+    )
+
     print_ascii_art(console)
 
     try:
@@ -78,17 +140,15 @@ def main(path: Optional[str] = None) -> None:
 
         if not path:
             # Show tree view of current directory
-            with Live(
-                loading_spinner("Scanning current directory..."),
-                refresh_per_second=8,
-                console=console,
-            ):
-                sleep(0.5)
-                directory_data = scan_directory(Path("."), max_depth=2)
+            directory_data = run_with_spinner(
+                "Scanning current directory...", scan_directory, Path("."), 2
+            )
 
             tree = format_directory_tree(directory_data)
             console.print(
-                Panel(tree, title="Current Directory Structure", border_style="cyan")
+                Panel(
+                    Text(tree), title="Current Directory Structure", border_style="cyan"
+                )
             )
 
             # Show improved context menu
@@ -125,14 +185,10 @@ def main(path: Optional[str] = None) -> None:
                 return
             console.print(info_panel(f"Using specified path: {path}"))
 
-        # Create and start the application using the factory
-        with Live(
-            loading_spinner("Initializing Grok agent..."),
-            refresh_per_second=8,
-            console=console,
-        ):
-            sleep(0.5)
-            agent = AppFactory.create_app_with_context(context_path)
+        # Create the agent behind a spinner (model discovery may hit the
+        # network), then run the session outside of any Live display
+        agent = run_with_spinner("Initializing Grok agent...", AppFactory.create_app)
+        AppFactory.run_app(agent, context_path)
 
     except ValueError as e:
         console.print(error_panel(str(e)))
@@ -1,27 +1,55 @@
 """Core Agent class for managing interactive Grok sessions."""
 
-import re
-from typing import Optional, List
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, List
 from pathlib import Path
 
-from rich.console import Console
+from rich.console import Console, ConsoleOptions, Group, RenderableType, RenderResult
 from rich.panel import Panel
-from rich.prompt import Prompt, Confirm
+from rich.text import Text
 
 from grok_cli.api.client import GrokAPIClient
 from grok_cli.utils.file_handler import (
     validate_paths,
-    get_file_context,
-    get_directory_context,
+    iter_file_context,
+    iter_directory_context,
 )
 from grok_cli.utils.command_parser import extract_shell_commands
 from grok_cli.utils.command_executor import run_shell_command
+from grok_cli.utils.console import console
 
-console = Console()
+# Inputs that end the interactive session
+_EXIT_WORDS = frozenset(("exit", "quit"))
 
-SHELL_CMD_PATTERN = re.compile(
-    r"```(?:bash|sh)?\n([\s\S]+?)\n```|\$ (.+)", re.MULTILINE
-)
+# Context summaries longer than this are cut down to the first few rows
+SUMMARY_MAX_ROWS = 200
+SUMMARY_HEAD_ROWS = 50
+
+# Chat prompt, parsed from markup once instead of on every turn; the "prompt"
+# base style matches what Prompt.ask applies to plain strings
+_USER_PROMPT = Text.from_markup("[bold blue]You[/bold blue]", style="prompt")
+
+
+class _ReplyTail:
+    """Live view of a streaming reply: a panel holding only its last lines.
+
+    Live cannot redraw rows that have scrolled off the terminal, so the view
+    is kept within the screen height while the reply grows.
+    """
+
+    def __init__(self, reply: Text) -> None:
+        self.reply = reply
+
+    def __rich_console__(
+        self, console: Console, options: ConsoleOptions
+    ) -> RenderResult:
+        # Panel borders and padding take 4 columns and 2 rows; one more row
+        # is left for the cursor
+        lines = self.reply.wrap(console, max(1, options.max_width - 4))
+        visible = max(1, options.size.height - 3)
+        tail = Text("\n").join(lines[-visible:])
+        yield Panel(tail, title="Grok", border_style="cyan")
 
 
 class GrokAgent:
@@ -35,6 +63,10 @@ class GrokAgent:
         """
         self.api_client = api_client
         self.is_running = False
+        # Working directory captured once for the session
+        self._cwd = Path.cwd()
+        # Status lines collected during a section and printed together
+        self._line_buffer: List[RenderableType] = []
 
     def start_session(self, context_path: Optional[Path] = None) -> None:
         """Start an interactive session with optional context.
@@ -46,9 +78,6 @@ class GrokAgent:
             self._setup_context(context_path)
         else:
             # No context provided, start with empty context
-            from rich.console import Console
-
-            console = Console()
             console.print("[dim]Starting session without context...[/dim]")
 
         self._run_interactive_loop()
@@ -70,28 +99,35 @@ class GrokAgent:
         Args:
             context_path: Path to use as context
         """
-        if not context_path.exists():
+        # One stat answers existence here and file/dir type in validate_paths
+        try:
+            st = os.stat(context_path)
+        except OSError:
             console.print(f"[red]✗[/red] Path does not exist: {context_path}")
             return
 
         console.print(f"[bold]Using specified path: {context_path}[/bold]")
-        self._process_context([str(context_path)])
+        self._process_context([str(context_path)], {str(context_path): st})
 
     def _setup_current_directory_context(self) -> None:
         """Set up context from current directory."""
-        current_dir = Path.cwd()
-        console.print(f"[bold]Using current directory: {current_dir}[/bold]")
+        console.print(f"[bold]Using current directory: {self._cwd}[/bold]")
         self._process_context(["."])
 
-    def _process_context(self, context_paths: List[str]) -> None:
+    def _process_context(
+        self,
+        context_paths: List[str],
+        stat_results: Optional[Dict[str, os.stat_result]] = None,
+    ) -> None:
         """Process context paths and set up API client context.
 
         Args:
             context_paths: List of paths to process
+            stat_results: Optional stat results already taken for some paths
         """
         console.print("\n[bold]Processing context...[/bold]")
 
-        valid_files, valid_dirs = validate_paths(context_paths)
+        valid_files, valid_dirs = validate_paths(context_paths, stat_results)
 
         if not valid_files and not valid_dirs:
             console.print("[red]No valid files or directories found. Exiting.[/red]")
@@ -116,10 +152,20 @@ class GrokAgent:
         summary_table.add_column("Path", style="green")
         summary_table.add_column("Status", style="yellow")
 
-        for file_path in valid_files:
-            summary_table.add_row("📄 File", str(file_path), "✅ Valid")
-        for dir_path in valid_dirs:
-            summary_table.add_row("📁 Directory", str(dir_path), "✅ Valid")
+        # Paths are wrapped in Text so brackets in names are not read as markup
+        rows = [("📄 File", Text(str(p)), "✅ Valid") for p in valid_files]
+        rows += [("📁 Directory", Text(str(p)), "✅ Valid") for p in valid_dirs]
+
+        # Rendering is O(rows), so very long summaries only show their head
+        hidden = 0
+        if len(rows) > SUMMARY_MAX_ROWS:
+            hidden = len(rows) - SUMMARY_HEAD_ROWS
+            rows = rows[:SUMMARY_HEAD_ROWS]
+
+        for row in rows:
+            summary_table.add_row(*row)
+        if hidden:
+            summary_table.add_row("…", f"... {hidden} more", "")
 
         console.print(summary_table)
 
@@ -132,12 +178,14 @@ class GrokAgent:
             valid_files: List of valid files
             valid_dirs: List of valid directories
         """
-        total_context = ""
+        # Collected pieces (file contents included as-is) are joined once at
+        # the end, so the full context is only copied a single time
+        parts: List[str] = []
 
         if valid_files:
             console.print(f"\n[bold]Reading {len(valid_files)} file(s)...[/bold]")
-            file_context = get_file_context(valid_files)
-            total_context += file_context + "\n"
+            parts.extend(iter_file_context(valid_files))
+            parts.append("\n")
             console.print(
                 f"[green]✓[/green] Successfully read {len(valid_files)} file(s)"
             )
@@ -146,46 +194,82 @@ class GrokAgent:
             console.print(
                 f"\n[bold]Scanning {len(valid_dirs)} directory(ies)...[/bold]"
             )
-            for dir_path in valid_dirs:
-                console.print(f"  Scanning: {dir_path}")
-                from grok_cli.utils.file_handler import scan_directory
+            from grok_cli.utils.file_handler import MAX_IO_WORKERS, scan_directory
+
+            # Scan all directories concurrently; the results are handed to
+            # iter_directory_context below instead of being looked up again
+            with ThreadPoolExecutor(
+                max_workers=min(MAX_IO_WORKERS, len(valid_dirs))
+            ) as executor:
+                scans = list(
+                    executor.map(lambda d: scan_directory(d, max_depth=3), valid_dirs)
+                )
 
-                directory_data = scan_directory(dir_path, max_depth=3)
+            for dir_path, directory_data in zip(valid_dirs, scans):
+                self._buffer_line(f"  Scanning: {dir_path}")
                 if directory_data:
-                    console.print(
+                    self._buffer_line(
                         f"  [green]✓[/green] Found {len(directory_data.get('files', []))} files"
                     )
-                    console.print(
+                    self._buffer_line(
                         f"  [green]✓[/green] Found {len(directory_data.get('directories', []))} subdirectories"
                     )
                 else:
-                    console.print(f"  [red]✗[/red] Failed to scan {dir_path}")
+                    self._buffer_line(f"  [red]✗[/red] Failed to scan {dir_path}")
 
-            directory_context = get_directory_context(valid_dirs)
-            total_context += directory_context + "\n"
-            console.print(
+            parts.extend(iter_directory_context(valid_dirs, scans))
+            parts.append("\n")
+            self._buffer_line(
                 f"[green]✓[/green] Successfully scanned {len(valid_dirs)} directory(ies)"
             )
+            self._flush()
 
+        total_context = "".join(parts)
+        # Drop the pieces and keep only what the preview needs, so the
+        # client's copy is the only full context left alive while rendering
+        del parts
         if total_context:
+            preview = total_context[:500]
+            size = len(total_context)
             self.api_client.set_context(total_context)
-            self._display_context_preview(total_context)
+            del total_context
+            self._display_context_preview(preview, size)
         else:
             console.print("\n[dim]No context found. Starting with empty context.[/dim]")
 
-    def _display_context_preview(self, context: str) -> None:
+    def _buffer_line(self, markup: str) -> None:
+        """Queue a status line to be printed by the next _flush.
+
+        Args:
+            markup: Rich markup for the line
+        """
+        self._line_buffer.append(Text.from_markup(markup))
+
+    def _flush(self) -> None:
+        """Print all buffered status lines in a single console write."""
+        if self._line_buffer:
+            console.print(Group(*self._line_buffer))
+            self._line_buffer.clear()
+
+    def _display_context_preview(self, preview: str, size: int) -> None:
         """Display a preview of the context.
 
         Args:
-            context: The context string to preview
+            preview: The first characters of the context (up to 500)
+            size: Total context size in characters
         """
-        context_preview = context[:500] + "..." if len(context) > 500 else context
+        context_preview = preview + "..." if size > len(preview) else preview
         console.print(f"\n[bold]Context Preview:[/bold]")
-        console.print(Panel(context_preview, title="Context", border_style="green"))
-        console.print(f"\n[dim]Total context size: {len(context)} characters[/dim]")
+        # File contents are plain text, not markup
+        console.print(
+            Panel(Text(context_preview), title="Context", border_style="green")
+        )
+        console.print(f"\n[dim]Total context size: {size} characters[/dim]")
 
     def _run_interactive_loop(self) -> None:
         """Run the main interactive chat loop."""
+        from rich.prompt import Prompt
+
         console.print(
             Panel(
                 "[bold green]Entering interactive chat mode. Type 'exit' or 'quit' to leave.[/bold green]",
@@ -198,9 +282,7 @@ class GrokAgent:
 
         while self.is_running:
             try:
-                user_input = Prompt.ask(
-                    "[bold blue]You[/bold blue]", default="", show_default=False
-                )
+                user_input = Prompt.ask(_USER_PROMPT, default="", show_default=False)
 
                 if self._should_exit(user_input):
                     break
@@ -225,7 +307,8 @@ class GrokAgent:
         Returns:
             True if user wants to exit
         """
-        if user_input.strip().lower() in {"exit", "quit"}:
+        command = user_input.strip().lower()
+        if command in _EXIT_WORDS:
             console.print("[yellow]Exiting interactive session...[/yellow]")
             return True
         return False
@@ -236,13 +319,34 @@ class GrokAgent:
         Args:
             user_input: User's input message
         """
-        response = self.api_client.send_message(user_input)
+        from rich.live import Live
+
+        # Render the reply as it streams in; Live picks up the growing Text.
+        # The live view shows the latest screenful, and the full reply is
+        # printed once the stream ends.
+        reply = Text()
+        stream = self.api_client.send_message_stream(user_input)
+        complete = False
+        with Live(
+            _ReplyTail(reply), console=console, refresh_per_second=10, transient=True
+        ):
+            try:
+                while True:
+                    reply.append(next(stream))
+            except StopIteration as done:
+                complete = done.value
+
+        response = reply.plain
+        if not response:
+            console.print("[red]✗[/red] No response from Grok.")
+            return
 
-        if response:
-            console.print(Panel(response, title="Grok", border_style="cyan"))
+        console.print(Panel(reply, title="Grok", border_style="cyan"))
+        # A reply cut short may end inside a command, so none are offered
+        if complete:
             self._handle_shell_commands(response)
         else:
-            console.print("[red]✗[/red] No response from Grok.")
+            console.print("[dim]Reply incomplete; shell commands not offered.[/dim]")
 
     def _handle_shell_commands(self, response: str) -> None:
         """Extract and handle shell commands from the response.
@@ -252,17 +356,87 @@ class GrokAgent:
         """
         commands = extract_shell_commands(response)
 
-        if commands:
-            for cmd in commands:
-                console.print(
-                    Panel(cmd, title="Suggested Shell Command", border_style="yellow")
-                )
-                if Confirm.ask(
-                    f"[bold yellow]Run this command?[/bold yellow]", default=False
-                ):
-                    run_shell_command(cmd)
-                else:
-                    console.print("[dim]Command not executed.[/dim]")
+        if len(commands) == 1:
+            from rich.prompt import Confirm
+
+            cmd = commands[0]
+            console.print(
+                Panel(Text(cmd), title="Suggested Shell Command", border_style="yellow")
+            )
+            if Confirm.ask(
+                f"[bold yellow]Run this command?[/bold yellow]", default=False
+            ):
+                run_shell_command(cmd)
+            else:
+                console.print("[dim]Command not executed.[/dim]")
+        elif commands:
+            self._handle_multiple_commands(commands)
+
+    def _handle_multiple_commands(self, commands: List[str]) -> None:
+        """Show several suggested commands together and ask once which to run.
+
+        Args:
+            commands: Shell commands extracted from the response
+        """
+        from rich.prompt import Prompt
+        from rich.table import Table
+
+        command_table = Table(show_header=False, box=None)
+        command_table.add_column("#", style="bold yellow", justify="right")
+        command_table.add_column("Command")
+        for number, cmd in enumerate(commands, 1):
+            command_table.add_row(str(number), Text(cmd))
+        console.print(
+            Panel(
+                command_table, title="Suggested Shell Commands", border_style="yellow"
+            )
+        )
+
+        # Built once, as the question is asked again after an invalid answer
+        question = Text.from_markup(
+            f"[bold yellow]Run which?[/bold yellow] "
+            f"\\[a = all, n = none, or numbers 1-{len(commands)} like 1,3]",
+            style="prompt",
+        )
+        while True:
+            answer = Prompt.ask(question, default="n")
+            selection = self._parse_command_selection(answer, len(commands))
+            if selection is not None:
+                break
+            console.print(f"[red]✗[/red] Invalid selection: {answer}")
+
+        if not selection:
+            console.print("[dim]No commands executed.[/dim]")
+            return
+
+        for index in selection:
+            run_shell_command(commands[index])
+
+    @staticmethod
+    def _parse_command_selection(answer: str, count: int) -> Optional[List[int]]:
+        """Parse a command selection such as "a", "n" or "1,3".
+
+        Args:
+            answer: User's answer to the selection prompt
+            count: Number of commands on offer
+
+        Returns:
+            Zero-based indexes to run in order (empty for none), or None if the
+            answer is invalid
+        """
+        answer = answer.strip().lower()
+        if answer in ("a", "all"):
+            return list(range(count))
+        if answer in ("", "n", "none"):
+            return []
+
+        selection = []
+        for part in answer.replace(",", " ").split():
+            if not part.isdigit() or not 1 <= int(part) <= count:
+                return None
+            selection.append(int(part) - 1)
+        # Drop repeats while keeping the order the user gave
+        return list(dict.fromkeys(selection))
 
     def _end_session(self) -> None:
         """Clean up and end the session."""
@@ -37,19 +37,35 @@ class AppFactory:
 
         return GrokAgent(api_client)
 
+    @staticmethod
+    def create_app() -> GrokAgent:
+        """Create a complete application without starting its session.
+
+        Returns:
+            Configured Grok agent ready for run_app
+        """
+        return AppFactory.create_agent()
+
+    @staticmethod
+    def run_app(agent: GrokAgent, context_path: Optional[Path] = None) -> None:
+        """Run an interactive session for an agent; blocks until it ends.
+
+        Args:
+            agent: Agent returned by create_app
+            context_path: Optional path to use as context (None for no context)
+        """
+        agent.start_session(context_path)
+
     @staticmethod
     def create_app_with_context(context_path: Optional[Path] = None) -> GrokAgent:
-        """Create a complete application with context.
+        """Create a complete application and run its session with context.
 
         Args:
             context_path: Optional path to use as context (None for no context)
 
         Returns:
-            Configured Grok agent ready for session
+            The agent, once its session has ended
         """
-        agent = AppFactory.create_agent()
-
-        # Start the session with the given context (or None for no context)
-        agent.start_session(context_path)
-
+        agent = AppFactory.create_app()
+        AppFactory.run_app(agent, context_path)
         return agent
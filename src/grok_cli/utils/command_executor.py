@@ -1,11 +1,121 @@
 """Command execution utilities for running shell commands."""
 
+import codecs
+import os
+import re
+import shlex
 import subprocess
-from typing import Optional
-from rich.console import Console
+from collections import deque
+from functools import lru_cache
+from typing import Any, Deque, Optional
 from rich.panel import Panel
+from rich.text import Text
 
-console = Console()
+from grok_cli.utils.console import console
+
+# Size of each raw read from the child's output pipe
+READ_CHUNK_SIZE = 65536
+
+# Characters that need /bin/sh (pipes, redirection, expansion, globbing, ...);
+# commands without any of them are executed directly
+SHELL_SYNTAX_CHARS = frozenset("<>|&;*?[`$~(){}#!\n")
+
+# Shell builtins (POSIX special and regular ones, plus common extensions);
+# several also exist as executables (echo, printf, test, ...) that behave
+# differently, so these always run through the shell
+SHELL_BUILTINS = frozenset(
+    {
+        ".",
+        ":",
+        "alias",
+        "bg",
+        "break",
+        "cd",
+        "command",
+        "continue",
+        "echo",
+        "eval",
+        "exec",
+        "exit",
+        "export",
+        "false",
+        "fc",
+        "fg",
+        "getopts",
+        "hash",
+        "jobs",
+        "kill",
+        "local",
+        "printf",
+        "pwd",
+        "read",
+        "readonly",
+        "return",
+        "set",
+        "shift",
+        "source",
+        "test",
+        "times",
+        "trap",
+        "true",
+        "type",
+        "ulimit",
+        "umask",
+        "unalias",
+        "unset",
+        "wait",
+    }
+)
+
+# Output kept by run_shell_command_silent; only the last this many bytes are kept
+SILENT_OUTPUT_LIMIT = 1024 * 1024
+
+# Potentially dangerous commands
+DANGEROUS_PATTERNS = (
+    r"\brm\s+-rf\b",  # rm -rf
+    r"\bdd\b",  # dd command
+    r"\bformat\b",  # format commands
+    r"\bchmod\s+777\b",  # chmod 777
+    r"\bchown\s+root\b",  # chown root
+    r"\bmkfs\b",  # filesystem creation
+    r"\bdd\s+if=",  # dd with input file
+    r"\b>.*\.\*",  # redirect to wildcard
+    r"\brm\s+.*\*",  # rm with wildcards
+)
+
+# All of the above fused into one alternation, so a command is scanned once
+DANGEROUS_PATTERN = re.compile(
+    "|".join(f"(?:{pattern})" for pattern in DANGEROUS_PATTERNS), re.IGNORECASE
+)
+
+
+def _spawn(command: str, **popen_kwargs: Any) -> subprocess.Popen:
+    """Start a command, skipping /bin/sh when it uses no shell syntax.
+
+    Simple commands are split with shlex and executed directly, saving the
+    extra shell process. Anything else still runs through the shell: shell
+    syntax, shell builtins (which may differ from a same-named executable),
+    and commands the OS refuses to exec, such as scripts without a shebang.
+
+    Args:
+        command: Shell command to execute
+        **popen_kwargs: Extra arguments for subprocess.Popen
+
+    Returns:
+        The started process
+    """
+    if not SHELL_SYNTAX_CHARS.intersection(command):
+        try:
+            argv = shlex.split(command)
+        except ValueError:  # unbalanced quotes; let the shell report it
+            argv = []
+        # A leading NAME=value is an environment assignment only the shell knows
+        if argv and "=" not in argv[0] and argv[0] not in SHELL_BUILTINS:
+            try:
+                return subprocess.Popen(argv, **popen_kwargs)
+            except OSError:
+                pass  # missing, not executable or ENOEXEC; the shell decides
+    return subprocess.Popen(command, shell=True, **popen_kwargs)
 
 
 def run_shell_command(command: str, cwd: Optional[str] = None) -> int:
@@ -20,26 +130,45 @@ def run_shell_command(command: str, cwd: Optional[str] = None) -> int:
     """
     console.print(
         Panel(
-            f"[bold]Executing:[/bold]\n[blue]{command}[/blue]",
+            # The command comes from model output, so it must not be parsed
+            # as markup
+            Text.assemble(("Executing:", "bold"), "\n", (command, "blue")),
             title="Shell Command",
             border_style="yellow",
         )
     )
 
     try:
-        process = subprocess.Popen(
+        process = _spawn(
             command,
-            shell=True,
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
-            text=True,
+            bufsize=0,
             cwd=cwd,
         )
 
-        # Stream output in real-time
-        for line in process.stdout:
-            console.print(line.rstrip())
+        # Stream output in real-time as the child flushes it, writing raw
+        # bytes when the console is backed by a binary stream
+        assert process.stdout is not None  # stdout=PIPE above
+        console.file.flush()
+        binary_out = getattr(console.file, "buffer", None)
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        fd = process.stdout.fileno()
 
+        while True:
+            chunk = os.read(fd, READ_CHUNK_SIZE)
+            if not chunk:
+                break
+            if binary_out is not None:
+                binary_out.write(chunk)
+                binary_out.flush()
+            else:
+                console.file.write(decoder.decode(chunk))
+                console.file.flush()
+        if binary_out is None:
+            console.file.write(decoder.decode(b"", final=True))
+
+        process.stdout.close()
         process.wait()
         return process.returncode
 
@@ -58,18 +187,46 @@ def run_shell_command_silent(
         cwd: Working directory for command execution
 
     Returns:
-        Tuple of (exit_code, output)
+        Tuple of (exit_code, output); output is the last SILENT_OUTPUT_LIMIT
+        bytes the command wrote to stdout
     """
     try:
-        result = subprocess.run(
-            command, shell=True, capture_output=True, text=True, cwd=cwd
+        process = _spawn(
+            command,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            bufsize=0,
+            cwd=cwd,
         )
-        return result.returncode, result.stdout
+
+        # Drain stdout in large chunks, keeping only a bounded tail so noisy
+        # commands cannot grow memory without limit
+        assert process.stdout is not None  # stdout=PIPE above
+        tail: Deque[bytes] = deque()
+        kept = 0
+        fd = process.stdout.fileno()
+
+        while True:
+            chunk = os.read(fd, READ_CHUNK_SIZE)
+            if not chunk:
+                break
+            tail.append(chunk)
+            kept += len(chunk)
+            while kept - len(tail[0]) >= SILENT_OUTPUT_LIMIT:
+                kept -= len(tail.popleft())
+
+        process.stdout.close()
+        process.wait()
+        # Decode once, as run_shell_command does
+        output = b"".join(tail)[-SILENT_OUTPUT_LIMIT:]
+        return process.returncode, output.decode("utf-8", errors="replace")
 
     except Exception as e:
         return 1, str(e)
 
 
+# Suggested commands recur across replies; safety is a pure function of the text
+@lru_cache(maxsize=1024)
 def validate_command_safety(command: str) -> bool:
     """Validate if a command is safe to execute.
 
@@ -79,26 +236,7 @@ def validate_command_safety(command: str) -> bool:
     Returns:
         True if command is considered safe
     """
-    # List of potentially dangerous commands
-    dangerous_patterns = [
-        r"\brm\s+-rf\b",  # rm -rf
-        r"\bdd\b",  # dd command
-        r"\bformat\b",  # format commands
-        r"\bchmod\s+777\b",  # chmod 777
-        r"\bchown\s+root\b",  # chown root
-        r"\bmkfs\b",  # filesystem creation
-        r"\bdd\s+if=",  # dd with input file
-        r"\b>.*\.\*",  # redirect to wildcard
-        r"\brm\s+.*\*",  # rm with wildcards
-    ]
-
-    import re
-
-    for pattern in dangerous_patterns:
-        if re.search(pattern, command, re.IGNORECASE):
-            return False
-
-    return True
+    return DANGEROUS_PATTERN.search(command) is None
 
 
 def execute_with_confirmation(command: str, cwd: Optional[str] = None) -> int:
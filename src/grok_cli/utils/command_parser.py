@@ -3,11 +3,22 @@
 import re
 from typing import List
 
-
+# Both alternatives start with a literal character, which lets the regex engine
+# skip ahead to candidate positions. The "$ " form must start a line; that is
+# checked with a lookbehind after the "$" rather than a leading "^", which
+# would disable that fast path.
 SHELL_CMD_PATTERN = re.compile(
-    r"```(?:bash|sh)?\n([\s\S]+?)\n```|\$ (.+)", re.MULTILINE
+    r"```(?:bash|sh)?\n(.+?)\n```|\$(?<![^\n].) ([^\n]+)", re.DOTALL | re.ASCII
 )
 
+# Prefixes stripped from commands by clean_command, in the order they are tried
+COMMAND_PREFIXES = ("$", "sudo ", 'bash -c "', '"')
+
+
+def _may_contain_commands(text: str) -> bool:
+    """Cheap pre-check so replies without code fences or prompts skip the regex."""
+    return "```" in text or "$ " in text
+
 
 def extract_shell_commands(text: str) -> List[str]:
     """Extract shell commands from model output.
@@ -18,15 +29,16 @@ def extract_shell_commands(text: str) -> List[str]:
     Returns:
         List of extracted shell commands
     """
-    commands = []
-
-    for match in SHELL_CMD_PATTERN.finditer(text):
-        code_block, dollar_cmd = match.groups()
+    commands: List[str] = []
+    if not _may_contain_commands(text):
+        return commands
 
+    # findall yields plain (code_block, dollar_cmd) tuples in one pass,
+    # without building a Match object per hit
+    for code_block, dollar_cmd in SHELL_CMD_PATTERN.findall(text):
         if code_block:
-            # Handle multi-line code blocks
-            lines = code_block.strip().split("\n")
-            for line in lines:
+            # Handle multi-line code blocks; each line is stripped below
+            for line in code_block.split("\n"):
                 line = line.strip()
                 if line and not line.startswith("#"):  # Skip comments
                     commands.append(line)
@@ -46,7 +58,7 @@ def is_shell_command(text: str) -> bool:
     Returns:
         True if text contains shell commands
     """
-    return bool(SHELL_CMD_PATTERN.search(text))
+    return _may_contain_commands(text) and bool(SHELL_CMD_PATTERN.search(text))
 
 
 def clean_command(command: str) -> str:
@@ -59,10 +71,8 @@ def clean_command(command: str) -> str:
         Cleaned command string
     """
     # Remove common prefixes
-    prefixes_to_remove = ["$", "sudo ", 'bash -c "', '"']
-
     cleaned = command.strip()
-    for prefix in prefixes_to_remove:
+    for prefix in COMMAND_PREFIXES:
         if cleaned.startswith(prefix):
             cleaned = cleaned[len(prefix) :]
 
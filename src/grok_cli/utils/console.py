@@ -0,0 +1,58 @@
+"""Shared rich console for grok-cli.
+
+Every module prints through this one instance, so terminal detection runs
+once and all output goes through a single render lock.
+
+The Console (and rich.console itself) is only created on first use, so
+importing a module that may print does not pay for rich until it does.
+"""
+
+import threading
+from typing import TYPE_CHECKING, Any, Optional, cast
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+_console: Optional["Console"] = None
+_console_lock = threading.Lock()
+
+
+def get_console() -> "Console":
+    """Return the shared Console, creating it on first call.
+
+    Returns:
+        The process-wide rich Console
+    """
+    global _console
+    if _console is None:
+        # Scan threads may print their first message at the same time
+        with _console_lock:
+            if _console is None:
+                from rich.console import Console
+
+                _console = Console()
+    return _console
+
+
+class _LazyConsole:
+    """Stand-in for the shared Console that forwards to get_console()."""
+
+    __slots__ = ()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(get_console(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(get_console(), name, value)
+
+    # Special methods are looked up on the type, so rich's `with console:`
+    # (used by Live) needs them spelled out
+    def __enter__(self) -> "Console":
+        return get_console().__enter__()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        get_console().__exit__(*exc_info)
+
+
+# Typed as the Console it stands in for, so it can be passed to rich APIs
+console = cast("Console", _LazyConsole())
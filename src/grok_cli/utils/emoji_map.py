@@ -0,0 +1,70 @@
+"""File type emojis for directory trees.
+
+Kept free of rich so the file scanner can label files without loading the UI
+stack.
+"""
+
+FILE_EMOJI_MAP = {
+    ".py": "🐍",
+    ".js": "🟨",
+    ".ts": "🔷",
+    ".json": "📦",
+    ".md": "📄",
+    ".txt": "📝",
+    ".sh": "💻",
+    ".yaml": "🧾",
+    ".yml": "🧾",
+    ".html": "🌐",
+    ".css": "🎨",
+    ".csv": "📊",
+    ".xml": "🗂",
+    ".lock": "🔒",
+    ".toml": "⚙️",
+    ".ini": "⚙️",
+    ".cfg": "⚙️",
+    ".env": "🌱",
+    ".go": "🐹",
+    ".rs": "🦀",
+    ".java": "☕️",
+    ".c": "🔵",
+    ".cpp": "🔷",
+    ".h": "📘",
+    ".hpp": "📘",
+    ".rb": "💎",
+    ".php": "🐘",
+    ".swift": "🦅",
+    ".kt": "🟣",
+    ".scala": "🔴",
+    ".dart": "🎯",
+    ".vue": "🟩",
+    ".svelte": "🟧",
+    ".dockerfile": "🐳",
+    ".lockfile": "🔒",
+    ".bat": "🪟",
+    ".exe": "📦",
+    ".zip": "🗜",
+    ".tar": "🗜",
+    ".gz": "🗜",
+    ".pdf": "📕",
+    ".jpg": "🖼",
+    ".jpeg": "🖼",
+    ".png": "🖼",
+    ".gif": "🖼",
+    ".svg": "🖼",
+}
+
+FOLDER_EMOJI = "📁"
+DEFAULT_FILE_EMOJI = "📄"
+
+
+def get_file_emoji(filename: str) -> str:
+    """Return the emoji shown for a file name in directory trees.
+
+    The extension is found with rfind rather than os.path.splitext, as in
+    file_handler.is_text_filename; a leading dot (".env") is not an extension.
+    """
+    dot = filename.rfind(".")
+    if dot <= 0:
+        return DEFAULT_FILE_EMOJI
+    # Lowercase only the extension rather than the whole file name
+    return FILE_EMOJI_MAP.get(filename[dot:].lower(), DEFAULT_FILE_EMOJI)
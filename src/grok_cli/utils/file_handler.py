@@ -1,163 +1,253 @@
 """File and directory handling utilities for grok-cli."""
 
+import fnmatch
+import mmap
 import os
+import re
+import stat
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
-
-from rich.console import Console
-from rich.syntax import Syntax
-
-from grok_cli.utils.ui import get_file_emoji, FOLDER_EMOJI
-
-console = Console()
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from grok_cli.utils.console import console
+from grok_cli.utils.emoji_map import get_file_emoji, FOLDER_EMOJI
+
+# Upper bound on threads used for concurrent file reads and directory scans;
+# reads release the GIL but decoding does not, so scale with the CPU count
+MAX_IO_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Roots with more subdirectories than this are walked with concurrent listings
+PARALLEL_WALK_MIN_SUBDIRS = 4
+
+# Leading bytes sniffed to reject binary files before decoding
+BINARY_SNIFF_SIZE = 4096
+
+# Bytes that occur in text: printable ASCII, UTF-8 lead/continuation bytes and
+# the usual whitespace/control characters (BEL, BS, TAB, LF, VT, FF, CR, ESC)
+_TEXT_BYTES = bytes({7, 8, 9, 10, 11, 12, 13, 27} | set(range(0x20, 0x100)) - {0x7F})
+
+# Leading magic numbers of common binary formats (ELF, zip, PNG, PDF, gzip,
+# JPEG, GIF); PDF headers in particular can pass the byte-ratio check
+BINARY_SIGNATURES = (
+    b"\x7fELF",
+    b"PK\x03\x04",
+    b"\x89PNG",
+    b"%PDF",
+    b"\x1f\x8b",
+    b"\xff\xd8\xff",
+    b"GIF8",
+)
+
+# Files larger than this are decoded straight from an mmap of the page cache
+MMAP_THRESHOLD = 64 * 1024
+
+# Flags for opening files to read; reads go straight to the descriptor
+_OPEN_FLAGS = (
+    os.O_RDONLY
+    | getattr(os, "O_BINARY", 0)
+    | getattr(os, "O_CLOEXEC", 0)
+    | getattr(os, "O_NONBLOCK", 0)
+)
 
 # Common text file extensions that we can read
-TEXT_EXTENSIONS = {
-    ".py",
-    ".js",
-    ".ts",
-    ".jsx",
-    ".tsx",
-    ".html",
-    ".css",
-    ".scss",
-    ".sass",
-    ".json",
-    ".xml",
-    ".yaml",
-    ".yml",
-    ".toml",
-    ".ini",
-    ".cfg",
-    ".conf",
-    ".md",
-    ".txt",
-    ".rst",
-    ".log",
-    ".sql",
-    ".sh",
-    ".bash",
-    ".zsh",
-    ".fish",
-    ".dockerfile",
-    ".dockerignore",
-    ".gitignore",
-    ".env",
-    ".env.example",
-    ".yml",
-    ".yaml",
-    ".toml",
-    ".ini",
-    ".cfg",
-    ".conf",
-    ".properties",
-    ".java",
-    ".c",
-    ".cpp",
-    ".h",
-    ".hpp",
-    ".cs",
-    ".php",
-    ".rb",
-    ".go",
-    ".rs",
-    ".swift",
-    ".kt",
-    ".scala",
-    ".clj",
-    ".hs",
-    ".ml",
-    ".fs",
-    ".vue",
-    ".svelte",
-    ".astro",
-    ".elm",
-    ".cljs",
-    ".ex",
-    ".exs",
-    ".lock",
-    ".lockfile",
-    ".package-lock.json",
-    ".yarn.lock",
-}
+TEXT_EXTENSIONS = frozenset(
+    {
+        ".py",
+        ".js",
+        ".ts",
+        ".jsx",
+        ".tsx",
+        ".html",
+        ".css",
+        ".scss",
+        ".sass",
+        ".json",
+        ".xml",
+        ".yaml",
+        ".yml",
+        ".toml",
+        ".ini",
+        ".cfg",
+        ".conf",
+        ".md",
+        ".txt",
+        ".rst",
+        ".log",
+        ".sql",
+        ".sh",
+        ".bash",
+        ".zsh",
+        ".fish",
+        ".dockerfile",
+        ".dockerignore",
+        ".gitignore",
+        ".env",
+        ".env.example",
+        ".properties",
+        ".java",
+        ".c",
+        ".cpp",
+        ".h",
+        ".hpp",
+        ".cs",
+        ".php",
+        ".rb",
+        ".go",
+        ".rs",
+        ".swift",
+        ".kt",
+        ".scala",
+        ".clj",
+        ".hs",
+        ".ml",
+        ".fs",
+        ".vue",
+        ".svelte",
+        ".astro",
+        ".elm",
+        ".cljs",
+        ".ex",
+        ".exs",
+        ".lock",
+        ".lockfile",
+        ".package-lock.json",
+        ".yarn.lock",
+    }
+)
 
 # Directories to skip when scanning
-SKIP_DIRS = {
-    ".git",
-    ".svn",
-    ".hg",
-    "__pycache__",
-    "node_modules",
-    ".venv",
-    "venv",
-    "env",
-    ".env",
-    ".pytest_cache",
-    ".mypy_cache",
-    ".coverage",
-    "dist",
-    "build",
-    "target",
-    ".idea",
-    ".vscode",
-    ".DS_Store",
-    "Thumbs.db",
-    "*.egg-info",
-    "*.pyc",
-    "*.pyo",
-    "*.pyd",
-}
+SKIP_DIRS = frozenset(
+    {
+        ".git",
+        ".svn",
+        ".hg",
+        "__pycache__",
+        "node_modules",
+        ".venv",
+        "venv",
+        "env",
+        ".env",
+        ".pytest_cache",
+        ".mypy_cache",
+        ".coverage",
+        "dist",
+        "build",
+        "target",
+        ".idea",
+        ".vscode",
+        ".DS_Store",
+        "Thumbs.db",
+        "*.egg-info",
+        "*.pyc",
+        "*.pyo",
+        "*.pyd",
+    }
+)
+
+# SKIP_DIRS split into plain names and glob patterns (e.g. "*.egg-info"), the
+# patterns compiled into one regex so they are matched in a single call
+SKIP_EXACT = frozenset(name for name in SKIP_DIRS if "*" not in name)
+SKIP_GLOB_RE = re.compile(
+    "|".join(fnmatch.translate(pattern) for pattern in SKIP_DIRS if "*" in pattern)
+)
 
 
 def is_text_file(file_path: Path) -> bool:
     """Check if a file is a text file based on its extension."""
-    return file_path.suffix.lower() in TEXT_EXTENSIONS
+    return is_text_filename(file_path.name)
 
 
-def should_skip_directory(dir_name: str) -> bool:
-    """Check if a directory should be skipped during scanning."""
-    return dir_name in SKIP_DIRS or dir_name.startswith(".")
+def is_text_filename(name: str) -> bool:
+    """Check a bare file name against TEXT_EXTENSIONS without building a Path.
+
+    Matches Path.suffix semantics: a leading dot (".env") is not an extension.
+    """
+    dot = name.rfind(".")
+    return 0 < dot < len(name) - 1 and name[dot:].lower() in TEXT_EXTENSIONS
 
 
-def read_file_contents(file_path: Path, max_size: int = 1024 * 1024) -> Optional[str]:
+def should_skip_directory(dir_name: str) -> bool:
+    """Check if a directory should be skipped during scanning."""
+    return (
+        dir_name in SKIP_EXACT
+        or dir_name.startswith(".")
+        or SKIP_GLOB_RE.match(dir_name) is not None
+    )
+
+
+def read_file_contents(
+    file_path: Union[str, Path],
+    max_size: int = 1024 * 1024,
+    *,
+    known_size: Optional[int] = None,
+) -> Optional[str]:
     """
     Read the contents of a file.
 
     Args:
-        file_path: Path to the file to read
+        file_path: Path to the file to read; plain strings (e.g. from
+            os.scandir) are accepted to avoid building a Path per file
         max_size: Maximum file size to read (default: 1MB)
+        known_size: Size from a stat the caller already made of this regular
+            file (e.g. during a scan); the fstat of the opened file is then
+            skipped
 
     Returns:
         File contents as string, or None if file cannot be read
     """
     try:
-        if not file_path.exists():
+        # Open first and fstat the descriptor: one lookup of the path covers
+        # existence, type and size. O_NONBLOCK keeps a FIFO from blocking the
+        # open before it is rejected; regular files ignore the flag.
+        try:
+            fd = os.open(file_path, _OPEN_FLAGS)
+        except FileNotFoundError:
             console.print(f"[red]Error: File {file_path} does not exist[/red]")
             return None
 
-        if not file_path.is_file():
-            console.print(f"[red]Error: {file_path} is not a file[/red]")
-            return None
-
-        # Check file size
-        file_size = file_path.stat().st_size
-        if file_size > max_size:
-            console.print(
-                f"[yellow]Warning: File {file_path} is too large ({file_size} bytes). Skipping.[/yellow]"
-            )
-            return None
-
-        # Read file contents
-        with open(file_path, "r", encoding="utf-8") as f:
-            content = f.read()
-
-        return content
+        try:
+            if known_size is None:
+                st = os.fstat(fd)
+                if not stat.S_ISREG(st.st_mode):
+                    console.print(f"[red]Error: {file_path} is not a file[/red]")
+                    return None
+                known_size = st.st_size
+
+            # Check file size
+            file_size = known_size
+            if file_size > max_size:
+                console.print(
+                    f"[yellow]Warning: File {file_path} is too large ({file_size} bytes). Skipping.[/yellow]"
+                )
+                return None
+
+            if file_size > MMAP_THRESHOLD:
+                with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+                    if _looks_binary(mm[:BINARY_SNIFF_SIZE]):
+                        _skip_binary_file(file_path)
+                        return None
+                    # Decode from the mapping without an intermediate bytes copy
+                    with memoryview(mm) as view:
+                        return _normalize_newlines(str(view, "utf-8"))
+
+            # Sniff before reading the rest, so binary files stop after the
+            # first BINARY_SNIFF_SIZE bytes
+            data = os.read(fd, BINARY_SNIFF_SIZE)
+            if _looks_binary(data):
+                _skip_binary_file(file_path)
+                return None
+            # A short read that already covers the stat size is EOF
+            if len(data) == BINARY_SNIFF_SIZE or len(data) < file_size:
+                data += _read_to_end(fd, file_size - len(data))
+            # Strict decoding still rejects binary files without NUL bytes
+            return _normalize_newlines(data.decode("utf-8"))
+        finally:
+            os.close(fd)
 
     except UnicodeDecodeError:
-        console.print(
-            f"[yellow]Warning: File {file_path} is not a text file. Skipping.[/yellow]"
-        )
+        _skip_binary_file(file_path)
         return None
     except PermissionError:
         console.print(f"[red]Error: Permission denied reading {file_path}[/red]")
@@ -167,10 +257,59 @@ def read_file_contents(file_path: Path, max_size: int = 1024 * 1024) -> Optional
         return None
 
 
-def scan_directory(directory_path: Path, max_depth: int = 3) -> Dict[str, any]:
+def _read_to_end(fd: int, size_hint: int) -> bytes:
+    """Read a descriptor until EOF, asking for the expected size up front.
+
+    Args:
+        fd: Open file descriptor
+        size_hint: Bytes expected to remain
+
+    Returns:
+        Everything left in the file
+    """
+    chunks: List[bytes] = []
+    while True:
+        chunk = os.read(fd, max(size_hint, BINARY_SNIFF_SIZE))
+        if not chunk:
+            return b"".join(chunks)
+        chunks.append(chunk)
+        size_hint -= len(chunk)
+
+
+def _looks_binary(head: bytes) -> bool:
+    """Sniff the start of a file for binary content without decoding it.
+
+    A known binary signature, any NUL byte, or too many bytes outside
+    _TEXT_BYTES (more than 1 in 32, and never fewer than two, so one stray
+    control byte in a short file is tolerated) marks the file as binary;
+    translate() counts those in a single C-level pass.
+    """
+    if head.startswith(BINARY_SIGNATURES) or b"\x00" in head:
+        return True
+    return len(head.translate(None, _TEXT_BYTES)) > max(1, len(head) // 32)
+
+
+def _normalize_newlines(text: str) -> str:
+    """Translate CRLF and lone CR line endings to LF, as text-mode reads did."""
+    if "\r" not in text:
+        return text
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
+def _skip_binary_file(file_path: Union[str, Path]) -> None:
+    """Warn that a file is being skipped because it is not text."""
+    console.print(
+        f"[yellow]Warning: File {file_path} is not a text file. Skipping.[/yellow]"
+    )
+
+
+def scan_directory(directory_path: Path, max_depth: int = 3) -> Dict[str, Any]:
     """
     Recursively scan a directory and create a tree structure.
 
+    The tree is walked first, collecting the text files to read; the reads,
+    which dominate on real repositories, then run concurrently.
+
     Args:
         directory_path: Path to the directory to scan
         max_depth: Maximum depth for recursive scanning
@@ -178,55 +317,166 @@ def scan_directory(directory_path: Path, max_depth: int = 3) -> Dict[str, any]:
     Returns:
         Dictionary containing directory structure and file contents
     """
-    if not directory_path.exists():
-        console.print(f"[red]Error: Directory {directory_path} does not exist[/red]")
-        return {}
+    pending: List[Tuple[Dict[str, Any], Dict[str, Any]]] = []
+    result = _walk_directory(directory_path, max_depth, pending)
+
+    if pending:
+        with ThreadPoolExecutor(
+            max_workers=min(MAX_IO_WORKERS, len(pending))
+        ) as executor:
+            # The walk already stat'ed every file for its size, so the reads
+            # reuse it instead of stat'ing again
+            contents = executor.map(
+                lambda item: read_file_contents(
+                    item[1]["path"], known_size=item[1]["size"]
+                ),
+                pending,
+            )
+            # pending is in walk order, so each directory keeps its sorted order
+            for (node, info), file_content in zip(pending, contents):
+                if file_content is not None:
+                    info["content"] = file_content
+                    node["files"].append(info)
+
+    return result
 
-    if not directory_path.is_dir():
-        console.print(f"[red]Error: {directory_path} is not a directory[/red]")
+
+def _walk_directory(
+    directory_path: Path,
+    max_depth: int,
+    pending: List[Tuple[Dict[str, Any], Dict[str, Any]]],
+) -> Dict[str, Any]:
+    """
+    Build the directory tree without reading any files.
+
+    The walk goes level by level. When the root has more than
+    PARALLEL_WALK_MIN_SUBDIRS subdirectories, each level's directories are
+    listed concurrently, which hides per-directory latency on cold caches and
+    network filesystems; small trees are walked serially.
+
+    Args:
+        directory_path: Path to the directory to walk
+        max_depth: Maximum depth below directory_path to descend into
+        pending: Receives (directory node, file info) pairs for the text files
+            to read; a directory that fails to scan contributes nothing
+
+    Returns:
+        Dictionary containing directory structure, with empty file lists
+    """
+    root = _directory_node(str(directory_path), directory_path.name)
+    listing = _list_directory(root["path"], max_depth)
+    if listing is None:
         return {}
 
-    result = {
-        "path": str(directory_path),
-        "name": directory_path.name,
-        "type": "directory",
-        "contents": {},
-        "files": [],
-        "directories": [],
-    }
+    # Directories listed so far whose children still need to be visited
+    level = [(root, listing)]
+    parallel = len(listing[1]) > PARALLEL_WALK_MIN_SUBDIRS
+
+    with ThreadPoolExecutor(max_workers=MAX_IO_WORKERS if parallel else 1) as executor:
+        while level:
+            # (child node, parent node, depth left for the child)
+            children = []
+            for node, (found, subdirs, depth) in level:
+                pending.extend((node, info) for info in found)
+                prefix = _child_prefix(node["path"])
+                for name in subdirs:
+                    children.append(
+                        (_directory_node(prefix + name, name), node, depth - 1)
+                    )
+
+            if parallel:
+                listings = executor.map(
+                    lambda child: _list_directory(child[0]["path"], child[2]), children
+                )
+            else:
+                listings = (_list_directory(c[0]["path"], c[2]) for c in children)
+
+            # children is grouped by parent in sorted order, so appending keeps
+            # every directory's subdirectories sorted
+            level = []
+            for (node, parent, _), child_listing in zip(children, listings):
+                if child_listing is not None:
+                    parent["directories"].append(node)
+                    parent["contents"][node["name"]] = node
+                    level.append((node, child_listing))
+
+    return root
+
+
+def _list_directory(
+    dir_path: str, depth: int
+) -> Optional[Tuple[List[Dict[str, Any]], List[str], int]]:
+    """
+    List one directory for the scan tree.
+
+    Args:
+        dir_path: Directory to list
+        depth: Depth left below this directory
+
+    Returns:
+        Tuple of (text file infos, subdirectory names to visit, depth), both
+        lists sorted by name, or None if the directory could not be scanned
+    """
+    prefix = _child_prefix(dir_path)
+    found = []
+    subdirs = []
 
     try:
-        for item in sorted(directory_path.iterdir()):
-            if item.name.startswith("."):
+        # scandir reports entry types from the directory listing itself, so
+        # only symlinks and kept files need a separate stat call
+        with os.scandir(dir_path) as it:
+            entries = sorted(it, key=attrgetter("name"))
+
+        for entry in entries:
+            name = entry.name
+            if name.startswith("."):
                 continue
 
-            if item.is_file() and is_text_file(item):
-                file_content = read_file_contents(item)
-                if file_content is not None:
-                    result["files"].append(
+            if entry.is_file():
+                if is_text_filename(name):
+                    found.append(
                         {
-                            "name": item.name,
-                            "path": str(item),
-                            "size": item.stat().st_size,
-                            "content": file_content,
+                            "name": name,
+                            "path": prefix + name,
+                            "size": entry.stat().st_size,
                         }
                     )
 
-            elif item.is_dir() and not should_skip_directory(item.name):
-                if max_depth > 0:
-                    sub_result = scan_directory(item, max_depth - 1)
-                    if sub_result:
-                        result["directories"].append(sub_result)
-                        result["contents"][item.name] = sub_result
+            elif entry.is_dir() and not should_skip_directory(name):
+                if depth > 0:
+                    subdirs.append(name)
 
+    except FileNotFoundError:
+        console.print(f"[red]Error: Directory {dir_path} does not exist[/red]")
+        return None
+    except NotADirectoryError:
+        console.print(f"[red]Error: {dir_path} is not a directory[/red]")
+        return None
     except PermissionError:
-        console.print(f"[red]Error: Permission denied accessing {directory_path}[/red]")
-        return {}
+        console.print(f"[red]Error: Permission denied accessing {dir_path}[/red]")
+        return None
     except Exception as e:
-        console.print(f"[red]Error scanning {directory_path}: {e}[/red]")
-        return {}
+        console.print(f"[red]Error scanning {dir_path}: {e}[/red]")
+        return None
+
+    return found, subdirs, depth
 
-    return result
+
+def _child_prefix(dir_path: str) -> str:
+    """Prefix for child paths, joined the way Path does ("." yields "name")."""
+    return "" if dir_path == "." else os.path.join(dir_path, "")
+
+
+def _directory_node(path: str, name: str) -> Dict[str, Any]:
+    """Create an empty directory entry for the scan tree."""
+    return {
+        "path": path,
+        "name": name,
+        "type": "directory",
+        "contents": {},
+        "files": [],
+        "directories": [],
+    }
 
 
 def format_directory_tree(directory_data: Dict, indent: str = "") -> str:
@@ -240,30 +490,49 @@ def format_directory_tree(directory_data: Dict, indent: str = "") -> str:
     Returns:
         Formatted tree structure as string
     """
+    lines: List[str] = []
+    _format_directory_tree_lines(directory_data, indent, lines)
+    return "\n".join(lines)
+
+
+def _format_directory_tree_lines(
+    directory_data: Dict, indent: str, lines: List[str]
+) -> None:
+    """
+    Append the tree lines for a directory and its subdirectories.
+
+    Subdirectories append to the same list, so the tree is joined only once.
+
+    Args:
+        directory_data: Directory data from scan_directory
+        indent: Current indentation string
+        lines: List receiving the formatted lines
+    """
     if not directory_data:
-        return ""
+        return
 
-    lines = []
-    path = directory_data.get("path", "")
     name = directory_data.get("name", "")
 
     # Add directory line
     lines.append(f"{indent}{FOLDER_EMOJI} {name}/")
 
+    # Files and subdirectories share one indent, built once per directory
+    child_indent = indent + "  "
+
     # Add files
     for file_info in directory_data.get("files", []):
         file_name = file_info["name"]
         file_size = file_info["size"]
         emoji = get_file_emoji(file_name)
-        size_str = f" ({file_size} bytes)" if file_size > 1024 else ""
-        lines.append(f"{indent}  {emoji} {file_name}{size_str}")
+        # Sizes of 1 KiB and under are left out of the tree
+        if file_size > 1024:
+            lines.append(f"{child_indent}{emoji} {file_name} ({file_size} bytes)")
+        else:
+            lines.append(f"{child_indent}{emoji} {file_name}")
 
     # Add subdirectories
     for subdir in directory_data.get("directories", []):
-        sub_lines = format_directory_tree(subdir, indent + "  ")
-        lines.extend(sub_lines.split("\n"))
-
-    return "\n".join(lines)
+        _format_directory_tree_lines(subdir, child_indent, lines)
 
 
 def get_file_context(file_paths: List[Path]) -> str:
@@ -276,71 +545,126 @@ def get_file_context(file_paths: List[Path]) -> str:
     Returns:
         Formatted string with file contents
     """
-    context_parts = []
+    return "".join(iter_file_context(file_paths))
 
-    for file_path in file_paths:
-        content = read_file_contents(file_path)
-        if content:
-            context_parts.append(f"# File: {file_path}\n{content}\n")
 
-    return "\n".join(context_parts)
+def iter_file_context(file_paths: List[Path]) -> Iterator[str]:
+    """
+    Yield the context for multiple files in pieces.
+
+    File contents are yielded as-is rather than copied into formatted
+    strings, so a consumer that joins everything once holds a single copy.
 
+    Args:
+        file_paths: List of file paths to read
 
-def get_directory_context(directory_paths: List[Path]) -> str:
+    Yields:
+        Pieces of the formatted file context, in order
+    """
+    if not file_paths:
+        return
+
+    # Reads are I/O bound and release the GIL, so overlap them
+    with ThreadPoolExecutor(
+        max_workers=min(MAX_IO_WORKERS, len(file_paths))
+    ) as executor:
+        contents = list(executor.map(read_file_contents, file_paths))
+
+    separator = ""
+    for file_path, content in zip(file_paths, contents):
+        if content:
+            yield f"{separator}# File: {file_path}\n"
+            yield content
+            yield "\n"
+            separator = "\n"
+
+
+def get_directory_context(
+    directory_paths: List[Path], scans: Optional[List[Dict[str, Any]]] = None
+) -> str:
     """
     Get context from multiple directories.
 
     Args:
         directory_paths: List of directory paths to scan
+        scans: Optional scan_directory results already obtained by the caller,
+            one per path, so the directories are not looked up again
 
     Returns:
         Formatted string with directory structure and file contents
     """
-    context_parts = []
+    return "".join(iter_directory_context(directory_paths, scans))
+
+
+def iter_directory_context(
+    directory_paths: List[Path], scans: Optional[List[Dict[str, Any]]] = None
+) -> Iterator[str]:
+    """
+    Yield the context for multiple directories in pieces.
+
+    Args:
+        directory_paths: List of directory paths to scan
+        scans: Optional scan_directory results already obtained by the caller,
+            one per path, so the directories are not looked up again
+
+    Yields:
+        Pieces of the formatted directory structure and file contents, in order
+    """
+    if scans is None:
+        scans = [scan_directory(directory_path) for directory_path in directory_paths]
 
-    for directory_path in directory_paths:
-        directory_data = scan_directory(directory_path)
+    separator = ""
+    for directory_path, directory_data in zip(directory_paths, scans):
         if directory_data:
             tree = format_directory_tree(directory_data)
-            context_parts.append(f"# Directory: {directory_path}\n{tree}\n")
+            yield f"{separator}# Directory: {directory_path}\n{tree}\n"
+            separator = "\n"
 
             # Add file contents
             for file_info in directory_data.get("files", []):
-                context_parts.append(
-                    f"# File: {file_info['path']}\n{file_info['content']}\n"
-                )
-
-    return "\n".join(context_parts)
+                yield f"\n# File: {file_info['path']}\n"
+                yield file_info["content"]
+                yield "\n"
 
 
-def validate_paths(paths: List[str]) -> Tuple[List[Path], List[Path]]:
+def validate_paths(
+    paths: List[str], stat_results: Optional[Dict[str, os.stat_result]] = None
+) -> Tuple[List[Path], List[Path]]:
     """
     Validate and categorize file and directory paths.
 
     Args:
         paths: List of path strings
+        stat_results: Optional stat results already taken by the caller,
+            keyed by path string, so those paths are not stat'ed again
 
     Returns:
         Tuple of (file_paths, directory_paths)
     """
     file_paths = []
     directory_paths = []
+    stat_results = stat_results or {}
 
     for path_str in paths:
         path = Path(path_str)
 
-        if not path.exists():
-            console.print(f"[red]Warning: Path {path} does not exist[/red]")
-            continue
+        # One stat covers existence and type
+        st = stat_results.get(path_str)
+        if st is None:
+            try:
+                st = os.stat(path)
+            except OSError:
+                console.print(f"[red]Warning: Path {path} does not exist[/red]")
+                continue
 
-        if path.is_file():
+        if stat.S_ISREG(st.st_mode):
             if is_text_file(path):
                 file_paths.append(path)
             else:
                 console.print(
                     f"[yellow]Warning: {path} is not a supported text file type[/yellow]"
                 )
-        elif path.is_dir():
+        elif stat.S_ISDIR(st.st_mode):
             directory_paths.append(path)
         else:
             console.print(f"[red]Warning: {path} is neither a file nor directory[/red]")
@@ -2,11 +2,20 @@
 
 from rich.console import Console
 from rich.panel import Panel
-from rich.spinner import Spinner
 from rich.text import Text
 from rich.style import Style
 from typing import Optional
-import os
+
+from grok_cli.utils.console import console as shared_console
+
+# Re-exported: the emoji table lives in a rich-free module so the file
+# scanner can use it without importing rich
+from grok_cli.utils.emoji_map import (  # noqa: F401
+    DEFAULT_FILE_EMOJI,
+    FILE_EMOJI_MAP,
+    FOLDER_EMOJI,
+    get_file_emoji,
+)
 
 GROK_ASCII_ART = r"""
 
@@ -22,67 +31,13 @@ GROK_ASCII_ART = r"""
 
 """
 
-FILE_EMOJI_MAP = {
-    ".py": "🐍",
-    ".js": "🟨",
-    ".ts": "🔷",
-    ".json": "📦",
-    ".md": "📄",
-    ".txt": "📝",
-    ".sh": "💻",
-    ".yaml": "🧾",
-    ".yml": "🧾",
-    ".html": "🌐",
-    ".css": "🎨",
-    ".csv": "📊",
-    ".xml": "🗂",
-    ".lock": "🔒",
-    ".toml": "⚙️",
-    ".ini": "⚙️",
-    ".cfg": "⚙️",
-    ".env": "🌱",
-    ".go": "🐹",
-    ".rs": "🦀",
-    ".java": "☕️",
-    ".c": "🔵",
-    ".cpp": "🔷",
-    ".h": "📘",
-    ".hpp": "📘",
-    ".rb": "💎",
-    ".php": "🐘",
-    ".swift": "🦅",
-    ".kt": "🟣",
-    ".scala": "🔴",
-    ".dart": "🎯",
-    ".vue": "🟩",
-    ".svelte": "🟧",
-    ".dockerfile": "🐳",
-    ".lockfile": "🔒",
-    ".bat": "🪟",
-    ".exe": "📦",
-    ".zip": "🗜",
-    ".tar": "🗜",
-    ".gz": "🗜",
-    ".pdf": "📕",
-    ".jpg": "🖼",
-    ".jpeg": "🖼",
-    ".png": "🖼",
-    ".gif": "🖼",
-    ".svg": "🖼",
-}
-
-FOLDER_EMOJI = "📁"
-DEFAULT_FILE_EMOJI = "📄"
-
-
-def get_file_emoji(filename: str) -> str:
-    _, ext = os.path.splitext(filename.lower())
-    return FILE_EMOJI_MAP.get(ext, DEFAULT_FILE_EMOJI)
+# Banner renderable built once at import; Text is not mutated on print
+_BANNER_TEXT = Text(GROK_ASCII_ART, style=Style(color="cyan", bold=True))
 
 
 def print_ascii_art(console: Optional[Console] = None) -> None:
-    c = console or Console()
-    c.print(Text(GROK_ASCII_ART, style=Style(color="cyan", bold=True)))
+    c = console or shared_console
+    c.print(_BANNER_TEXT)
 
 
 def error_panel(message: str, title: str = "Error") -> Panel:
@@ -98,4 +53,6 @@ def info_panel(message: str, title: str = "Info") -> Panel:
 
 
 def loading_spinner(text: str = "Loading..."):
+    from rich.spinner import Spinner
+
     return Spinner("dots", text=text, style="bold magenta")